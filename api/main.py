@@ -1,7 +1,9 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+import numpy as np
+from pydantic import BaseModel, Field
 from src.predict import predict
+from src.preprocess import DTYPES
 
 app = FastAPI(
     title="Airbnb Price Predictor",
@@ -17,17 +19,23 @@ app.add_middleware(
 )
 
 
+def int_field(col: str):
+    """Bound an integer field to the range of its compact dtype so overflow is a 422."""
+    info = np.iinfo(DTYPES[col])
+    return Field(ge=int(info.min), le=int(info.max))
+
+
 class PredictRequest(BaseModel):
     # All values must be label-encoded (matching sklearn LabelEncoder from preprocess.py)
-    room_type: int               # 0=Entire home/apt, 1=Hotel room, 2=Private room, 3=Shared room
-    neighbourhood_cleansed: int  # 0-19, alphabetical order
-    accommodates: int
+    room_type: int = int_field("room_type")  # 0=Entire home/apt, 1=Hotel room, 2=Private room, 3=Shared room
+    neighbourhood_cleansed: int = int_field("neighbourhood_cleansed")  # 0-19, alphabetical order
+    accommodates: int = int_field("accommodates")
     bedrooms: int
     bathrooms: float
-    number_of_reviews: int
+    number_of_reviews: int = int_field("number_of_reviews")
     review_scores_rating: float
-    availability_365: int
-    minimum_nights: int
+    availability_365: int = int_field("availability_365")
+    minimum_nights: int = int_field("minimum_nights")
 
 
 class PredictResponse(BaseModel):
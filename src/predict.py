@@ -2,6 +2,8 @@ import mlflow.xgboost
 import numpy as np
 import pandas as pd
 
+from src.preprocess import apply_schema
+
 
 def load_model(model_uri: str):
     import os
@@ -21,8 +23,9 @@ FEATURE_ORDER = [
 
 
 def predict(features: dict, model_uri: str = "models:/airbnb-price-predictor@champion"):
+    # Cast to the training schema first so out-of-range inputs fail before loading the model
+    df = apply_schema(pd.DataFrame([features])[FEATURE_ORDER])
     model = load_model(model_uri)
-    df = pd.DataFrame([features])[FEATURE_ORDER]
     log_prediction = model.predict(df)
     # Model was trained on log1p(price) — apply inverse transform
     return float(np.expm1(log_prediction[0]))
@@ -1,5 +1,6 @@
 import re
 import warnings
+import numpy as np
 import pandas as pd
 
 COLUMNS = [
@@ -15,6 +16,23 @@ COLUMNS = [
     "minimum_nights",
 ]
 
+# Compact dtype layout shared by the preprocessing output, train.load_features
+# and the serving feature buffer in predict.py. Features are float32 (what
+# XGBoost works in internally) or the smallest int that fits; price stays
+# float64 so the p99 cap and log1p target are unchanged.
+DTYPES = {
+    "room_type": "int8",
+    "neighbourhood_cleansed": "int16",
+    "accommodates": "int16",
+    "bedrooms": "float32",
+    "bathrooms": "float32",
+    "number_of_reviews": "int32",
+    "review_scores_rating": "float32",
+    "availability_365": "int16",
+    "minimum_nights": "int32",
+    "price": "float64",
+}
+
 
 def load_data(path: str) -> pd.DataFrame:
     df = pd.read_csv(path, dtype=str)
@@ -88,18 +106,45 @@ def fill_missing(df: pd.DataFrame) -> pd.DataFrame:
     numeric_cols = ["accommodates", "number_of_reviews", "availability_365", "minimum_nights"]
     for col in numeric_cols:
         df[col] = pd.to_numeric(df[col], errors="coerce")
-        df[col] = df[col].fillna(df[col].median())
+        median = df[col].median()
+        if pd.isna(median):
+            raise ValueError(
+                f"The '{col}' column has no numeric values. "
+                "Check that the listings.csv scrape includes it."
+            )
+        # Round half up so count columns stay whole numbers for their int dtype;
+        # whole-number medians fill exactly as before
+        df[col] = df[col].fillna(int(np.floor(median + 0.5)))
 
     return df
 
 
 def encode_categoricals(df: pd.DataFrame) -> pd.DataFrame:
     """Label-encode room_type and neighbourhood_cleansed."""
-    df["room_type"] = df["room_type"].astype("category").cat.codes
-    df["neighbourhood_cleansed"] = df["neighbourhood_cleansed"].astype("category").cat.codes
+    for col in ["room_type", "neighbourhood_cleansed"]:
+        df[col] = df[col].astype("category").cat.codes.astype(DTYPES[col])
     return df
 
 
+def apply_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast columns to the compact DTYPES layout.
+    Raise if an integer column holds missing, fractional or out-of-range values."""
+    for col in df.columns.intersection(list(DTYPES)):
+        dtype = np.dtype(DTYPES[col])
+        if dtype.kind == "i" and len(df):
+            if df[col].isna().any():
+                raise ValueError(f"Column '{col}' has missing values and cannot be stored as {dtype}.")
+            info = np.iinfo(dtype)
+            if df[col].min() < info.min or df[col].max() > info.max:
+                raise ValueError(
+                    f"Column '{col}' has values outside the {dtype} range "
+                    f"[{info.min}, {info.max}]."
+                )
+            if (df[col] % 1 != 0).any():
+                raise ValueError(f"Column '{col}' has fractional values and cannot be stored as {dtype}.")
+    return df.astype({col: DTYPES[col] for col in df.columns if col in DTYPES})
+
+
 def preprocess(
     input_path: str = "data/raw/listings.csv",
     output_path: str = "data/processed/listings_clean.csv",
@@ -121,7 +166,7 @@ def preprocess(
         "review_scores_rating", "availability_365", "minimum_nights",
         "price",
     ]
-    df = df[FINAL_COLUMNS]
+    df = apply_schema(df[FINAL_COLUMNS])
     df.to_csv(output_path, index=False)
     print(f"\nSaved cleaned data to {output_path}")
     print(f"  Final shape: {df.shape}")
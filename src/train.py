@@ -9,13 +9,15 @@ from xgboost import XGBRegressor
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_absolute_error, r2_score
 
+from src.preprocess import DTYPES
+
 load_dotenv()
 import dagshub
 dagshub.init(repo_owner="BradleyJason", repo_name="airbnb-price-predictor", mlflow=True)
 
 
 def load_features(path: str):
-    df = pd.read_csv(path)
+    df = pd.read_csv(path, dtype=DTYPES)
 
     # Cap outliers at the 99th percentile
     price_cap = df["price"].quantile(0.99)
@@ -5,10 +5,14 @@ and validates the output file's shape, columns, and data quality.
 """
 import os
 import tempfile
+from unittest.mock import patch
+import numpy as np
 import pytest
 import pandas as pd
+from xgboost import XGBRegressor
 
-from src.preprocess import preprocess
+from src.predict import predict
+from src.preprocess import DTYPES, preprocess
 
 EXPECTED_COLUMNS = {
     "price",
@@ -98,3 +102,34 @@ class TestFullPipeline:
 
         assert isinstance(result, pd.DataFrame)
         assert len(result) > 0
+
+    def test_returned_dataframe_uses_compact_dtypes(self, full_raw_df, tmp_path):
+        input_csv  = tmp_path / "listings.csv"
+        output_csv = tmp_path / "listings_clean.csv"
+        full_raw_df.to_csv(input_csv, index=False)
+
+        result = preprocess(str(input_csv), str(output_csv))
+
+        assert result.dtypes.astype(str).to_dict() == DTYPES
+
+    def test_float64_model_predicts_identically_on_compact_dtypes(self, full_raw_df, tmp_path):
+        input_csv  = tmp_path / "listings.csv"
+        output_csv = tmp_path / "listings_clean.csv"
+        full_raw_df.to_csv(input_csv, index=False)
+
+        preprocess(str(input_csv), str(output_csv))
+        wide_X = pd.read_csv(output_csv).drop(columns=["price"])
+        compact_X = pd.read_csv(output_csv, dtype=DTYPES).drop(columns=["price"])
+        wide_y = np.log1p(pd.read_csv(output_csv)["price"])
+
+        # The deployed @champion model was trained on the float64 layout
+        model = XGBRegressor(n_estimators=20, max_depth=3, random_state=42).fit(wide_X, wide_y)
+        wide_preds = model.predict(wide_X)
+
+        np.testing.assert_array_equal(wide_preds, model.predict(compact_X))
+
+        # Same model through the serving path, which applies the compact cast itself
+        with patch("src.predict.load_model", return_value=model):
+            served = [predict(row) for row in wide_X.to_dict(orient="records")]
+
+        np.testing.assert_array_equal(served, [float(np.expm1(p)) for p in wide_preds])
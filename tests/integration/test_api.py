@@ -69,3 +69,33 @@ async def test_predict_endpoint_model_error_returns_500():
 
     assert response.status_code == 500
     assert "model not found" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_predict_endpoint_out_of_range_feature_returns_422():
+    """A value that overflows its compact dtype is bad client input and never reaches the model."""
+    fake_model = MagicMock()
+    fake_model.predict.return_value = np.array([np.log1p(150.0)])
+    payload = {**VALID_PAYLOAD, "room_type": 200}
+
+    with patch("src.predict.mlflow.xgboost.load_model", return_value=fake_model), \
+         patch("dotenv.load_dotenv"):
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.post("/predict", json=payload)
+
+    assert response.status_code == 422
+    assert "predicted_price" not in response.json()
+    assert any(err["loc"][-1] == "room_type" for err in response.json()["detail"])
+    fake_model.predict.assert_not_called()
+
+
+def test_predict_rejects_out_of_range_feature_without_api():
+    """Direct predict() calls bypass PredictRequest, so apply_schema still guards the cast."""
+    from src.predict import predict
+
+    with patch("src.predict.load_model") as load_model, \
+         pytest.raises(ValueError, match="'room_type' has values outside the int8 range"):
+        predict({**VALID_PAYLOAD, "room_type": 200})
+
+    load_model.assert_not_called()
@@ -1,9 +1,12 @@
 """Unit tests for src/preprocess.py — no MLflow, no DagsHub, no file I/O."""
 import warnings
+import numpy as np
 import pytest
 import pandas as pd
 
-from src.preprocess import clean_price, clean_bathrooms, encode_categoricals
+from src.preprocess import (
+    DTYPES, apply_schema, clean_price, clean_bathrooms, encode_categoricals, fill_missing,
+)
 
 
 class TestCleanPrice:
@@ -62,6 +65,40 @@ class TestCleanBathrooms:
         assert "bathrooms" in result.columns
 
 
+class TestFillMissing:
+    def test_missing_counts_filled_with_whole_median(self, full_raw_df):
+        df = full_raw_df.copy()
+        df.loc[0, "number_of_reviews"] = None
+        result = fill_missing(df)
+        assert result["number_of_reviews"].isna().sum() == 0
+        assert (result["number_of_reviews"] % 1 == 0).all()
+
+    @pytest.mark.parametrize("col", ["accommodates", "number_of_reviews",
+                                     "availability_365", "minimum_nights"])
+    def test_whole_median_fill_matches_float64_baseline(self, full_raw_df, col):
+        df = full_raw_df.copy()
+        df.loc[0, col] = None  # 9 remaining values → whole-number median
+        values = pd.to_numeric(df[col], errors="coerce")
+        assert values.median() % 1 == 0
+        baseline = values.fillna(values.median())
+        result = fill_missing(df)
+        assert (result[col] == baseline).all()
+
+    @pytest.mark.parametrize("values, expected", [(["2", "3", None], 3), (["3", "4", None], 4)])
+    def test_half_integer_median_rounds_up(self, full_raw_df, values, expected):
+        df = full_raw_df.head(3).copy()
+        df["accommodates"] = values
+        result = fill_missing(df)
+        assert result["accommodates"].iloc[2] == expected
+
+    @pytest.mark.parametrize("col", ["number_of_reviews", "minimum_nights"])
+    def test_all_empty_count_column_raises(self, full_raw_df, col):
+        df = full_raw_df.copy()
+        df[col] = None
+        with pytest.raises(ValueError, match=f"'{col}' column has no numeric values"):
+            fill_missing(df)
+
+
 class TestEncodeCategoricals:
     def test_room_type_is_numeric(self, raw_categoricals_df):
         result = encode_categoricals(raw_categoricals_df.copy())
@@ -85,3 +122,55 @@ class TestEncodeCategoricals:
         result = encode_categoricals(raw_categoricals_df.copy())
         # "Louvre" appears at index 0 and 2 → same code
         assert result["neighbourhood_cleansed"].iloc[0] == result["neighbourhood_cleansed"].iloc[2]
+
+    def test_codes_use_compact_dtypes(self, raw_categoricals_df):
+        result = encode_categoricals(raw_categoricals_df.copy())
+        assert result["room_type"].dtype == "int8"
+        assert result["neighbourhood_cleansed"].dtype == "int16"
+
+
+class TestApplySchema:
+    def test_columns_cast_to_schema(self):
+        df = pd.DataFrame({col: [1, 2] for col in DTYPES})
+        result = apply_schema(df)
+        assert result.dtypes.astype(str).to_dict() == DTYPES
+
+    def test_unknown_columns_untouched(self):
+        df = pd.DataFrame({"accommodates": [2], "extra": [1.5]})
+        result = apply_schema(df)
+        assert result["extra"].dtype == "float64"
+
+    def test_out_of_range_raises(self):
+        df = pd.DataFrame({"room_type": [0, 300]})
+        with pytest.raises(ValueError, match="outside the int8 range"):
+            apply_schema(df)
+
+    @pytest.mark.parametrize("col, value", [("accommodates", 2.7), ("minimum_nights", 1.5)])
+    def test_fractional_value_in_int_column_raises(self, col, value):
+        df = pd.DataFrame({col: [1.0, value]})
+        with pytest.raises(ValueError, match=f"'{col}' has fractional values"):
+            apply_schema(df)
+
+    @pytest.mark.parametrize("col", ["room_type", "neighbourhood_cleansed", "accommodates",
+                                     "number_of_reviews", "availability_365", "minimum_nights"])
+    def test_exact_dtype_bounds_pass(self, col):
+        info = np.iinfo(DTYPES[col])
+        df = pd.DataFrame({col: [float(info.min), float(info.max)]})
+        result = apply_schema(df)
+        assert result[col].tolist() == [info.min, info.max]
+        assert result[col].dtype == DTYPES[col]
+
+    def test_float_sourced_count_overflow_raises(self):
+        df = pd.DataFrame({"number_of_reviews": [10.0, float(2**31)]})
+        with pytest.raises(ValueError, match="'number_of_reviews' has values outside the int32 range"):
+            apply_schema(df)
+
+    def test_negative_overflow_raises(self):
+        df = pd.DataFrame({"availability_365": [0, -(2**15) - 1]})
+        with pytest.raises(ValueError, match="'availability_365' has values outside the int16 range"):
+            apply_schema(df)
+
+    def test_missing_value_in_int_column_raises(self):
+        df = pd.DataFrame({"minimum_nights": [1.0, None]})
+        with pytest.raises(ValueError, match="'minimum_nights' has missing values"):
+            apply_schema(df)